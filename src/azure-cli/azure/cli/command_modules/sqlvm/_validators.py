@@ -3,14 +3,48 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
-from datetime import datetime
 from msrestazure.tools import resource_id, is_valid_resource_id
 from azure.cli.core.azclierror import (
     InvalidArgumentValueError,
     RequiredArgumentMissingError,
     MutuallyExclusiveArgumentError
 )
-from azure.cli.core.commands.client_factory import get_subscription_id
+
+
+def _fast_is_rid(s):
+    '''
+    Cheap pre-check before the full is_valid_resource_id parse. A bare name
+    can never contain '/' and can never be a valid ARM id, so the common
+    "name was passed" case is rejected without parsing the full ARM path.
+    '''
+    return bool(s) and '/' in s and is_valid_resource_id(s)
+
+
+# The validators below always build ids under fixed provider namespaces and
+# types, so a prebuilt template is much cheaper than msrestazure's
+# segment-by-segment resource_id builder. Names containing these characters
+# fall back to resource_id.
+_RID_UNSAFE = frozenset('/?#')
+_SQLVM_GROUP_RID_TMPL = ('/subscriptions/{sub}/resourceGroups/{rg}'
+                         '/providers/Microsoft.SqlVirtualMachine/sqlVirtualMachineGroups/{name}')
+_SQLVM_RID_TMPL = ('/subscriptions/{sub}/resourceGroups/{rg}'
+                   '/providers/Microsoft.SqlVirtualMachine/sqlVirtualMachines/{name}')
+_LB_RID_TMPL = ('/subscriptions/{sub}/resourceGroups/{rg}'
+                '/providers/Microsoft.Network/loadBalancers/{name}')
+_PUBLIC_IP_RID_TMPL = ('/subscriptions/{sub}/resourceGroups/{rg}'
+                       '/providers/Microsoft.Network/publicIPAddresses/{name}')
+_SUBNET_RID_TMPL = ('/subscriptions/{sub}/resourceGroups/{rg}'
+                    '/providers/Microsoft.Network/virtualNetworks/{vnet}/subnets/{subnet}')
+
+
+def _sub_id(cli_ctx):
+    '''
+    Returns the subscription id for cli_ctx. get_subscription_id already
+    memoizes it in cli_ctx.data (and honors the --subscription override
+    stored there), so repeat calls are just a dict get.
+    '''
+    from azure.cli.core.commands.client_factory import get_subscription_id
+    return get_subscription_id(cli_ctx)
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -20,13 +54,17 @@ def validate_sqlvm_group(cmd, namespace):
     '''
     group = namespace.sql_virtual_machine_group_resource_id
 
-    if group and not is_valid_resource_id(group):
-        namespace.sql_virtual_machine_group_resource_id = resource_id(
-            subscription=get_subscription_id(cmd.cli_ctx),
-            resource_group=namespace.resource_group_name,
-            namespace='Microsoft.SqlVirtualMachine', type='sqlVirtualMachineGroups',
-            name=group
-        )
+    if group and not _fast_is_rid(group):
+        if _RID_UNSAFE.isdisjoint(group):
+            namespace.sql_virtual_machine_group_resource_id = _SQLVM_GROUP_RID_TMPL.format(
+                sub=_sub_id(cmd.cli_ctx), rg=namespace.resource_group_name, name=group)
+        else:
+            namespace.sql_virtual_machine_group_resource_id = resource_id(
+                subscription=_sub_id(cmd.cli_ctx),
+                resource_group=namespace.resource_group_name,
+                namespace='Microsoft.SqlVirtualMachine', type='sqlVirtualMachineGroups',
+                name=group
+            )
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -36,15 +74,26 @@ def validate_sqlvm_list(cmd, namespace):
     '''
     vms = namespace.sql_virtual_machine_instances
 
+    # Hoist the loop invariants: subscription, resource group and the helpers
+    # themselves are the same for every element of the list.
+    sub = _sub_id(cmd.cli_ctx)
+    rg = namespace.resource_group_name
+    _rid = resource_id
+    _valid = _fast_is_rid
+
     for n, sqlvm in enumerate(vms):
-        if sqlvm and not is_valid_resource_id(sqlvm):
+        if sqlvm and not _valid(sqlvm):
             # add the correct resource id
-            namespace.sql_virtual_machine_instances[n] = resource_id(
-                subscription=get_subscription_id(cmd.cli_ctx),
-                resource_group=namespace.resource_group_name,
-                namespace='Microsoft.SqlVirtualMachine', type='sqlVirtualMachines',
-                name=sqlvm
-            )
+            if _RID_UNSAFE.isdisjoint(sqlvm):
+                namespace.sql_virtual_machine_instances[n] = _SQLVM_RID_TMPL.format(
+                    sub=sub, rg=rg, name=sqlvm)
+            else:
+                namespace.sql_virtual_machine_instances[n] = _rid(
+                    subscription=sub,
+                    resource_group=rg,
+                    namespace='Microsoft.SqlVirtualMachine', type='sqlVirtualMachines',
+                    name=sqlvm
+                )
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -54,13 +103,17 @@ def validate_load_balancer(cmd, namespace):
     '''
     lb = namespace.load_balancer_resource_id
 
-    if not is_valid_resource_id(lb):
-        namespace.load_balancer_resource_id = resource_id(
-            subscription=get_subscription_id(cmd.cli_ctx),
-            resource_group=namespace.resource_group_name,
-            namespace='Microsoft.Network', type='loadBalancers',
-            name=lb
-        )
+    if not _fast_is_rid(lb):
+        if _RID_UNSAFE.isdisjoint(lb):
+            namespace.load_balancer_resource_id = _LB_RID_TMPL.format(
+                sub=_sub_id(cmd.cli_ctx), rg=namespace.resource_group_name, name=lb)
+        else:
+            namespace.load_balancer_resource_id = resource_id(
+                subscription=_sub_id(cmd.cli_ctx),
+                resource_group=namespace.resource_group_name,
+                namespace='Microsoft.Network', type='loadBalancers',
+                name=lb
+            )
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -70,13 +123,17 @@ def validate_public_ip_address(cmd, namespace):
     '''
     public_ip = namespace.public_ip_address_resource_id
 
-    if public_ip and not is_valid_resource_id(public_ip):
-        namespace.public_ip_address_resource_id = resource_id(
-            subscription=get_subscription_id(cmd.cli_ctx),
-            resource_group=namespace.resource_group_name,
-            namespace='Microsoft.Network', type='publicIPAddresses',
-            name=public_ip
-        )
+    if public_ip and not _fast_is_rid(public_ip):
+        if _RID_UNSAFE.isdisjoint(public_ip):
+            namespace.public_ip_address_resource_id = _PUBLIC_IP_RID_TMPL.format(
+                sub=_sub_id(cmd.cli_ctx), rg=namespace.resource_group_name, name=public_ip)
+        else:
+            namespace.public_ip_address_resource_id = resource_id(
+                subscription=_sub_id(cmd.cli_ctx),
+                resource_group=namespace.resource_group_name,
+                namespace='Microsoft.Network', type='publicIPAddresses',
+                name=public_ip
+            )
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -90,18 +147,23 @@ def validate_subnet(cmd, namespace):
     if vnet and '/' in vnet:
         raise InvalidArgumentValueError("incorrect usage: --subnet ID | --subnet NAME --vnet-name NAME")
 
-    subnet_is_id = is_valid_resource_id(subnet)
+    subnet_is_id = _fast_is_rid(subnet)
     if (subnet_is_id and vnet) or (not subnet_is_id and not vnet):
         raise MutuallyExclusiveArgumentError("incorrect usage: --subnet ID | --subnet NAME --vnet-name NAME")
 
     if not subnet_is_id and vnet:
-        namespace.subnet_resource_id = resource_id(
-            subscription=get_subscription_id(cmd.cli_ctx),
-            resource_group=namespace.resource_group_name,
-            namespace='Microsoft.Network', type='virtualNetworks',
-            name=vnet, child_type_1='subnets',
-            child_name_1=subnet
-        )
+        if _RID_UNSAFE.isdisjoint(vnet) and _RID_UNSAFE.isdisjoint(subnet):
+            namespace.subnet_resource_id = _SUBNET_RID_TMPL.format(
+                sub=_sub_id(cmd.cli_ctx), rg=namespace.resource_group_name,
+                vnet=vnet, subnet=subnet)
+        else:
+            namespace.subnet_resource_id = resource_id(
+                subscription=_sub_id(cmd.cli_ctx),
+                resource_group=namespace.resource_group_name,
+                namespace='Microsoft.Network', type='virtualNetworks',
+                name=vnet, child_type_1='subnets',
+                child_name_1=subnet
+            )
 
 
 # pylint: disable=too-many-statements,line-too-long
@@ -142,34 +204,31 @@ def validate_assessment(namespace):
     '''
     enable_assessment = namespace.enable_assessment
     enable_assessment_schedule = namespace.enable_assessment_schedule
-    assessment_weekly_interval = namespace.assessment_weekly_interval
-    assessment_monthly_occurrence = namespace.assessment_monthly_occurrence
-    assessment_day_of_week = namespace.assessment_day_of_week
-    assessment_start_time_local = namespace.assessment_start_time_local
 
-    is_assessment_schedule_provided = False
-    if (assessment_weekly_interval is not None or
-            assessment_weekly_interval is not None or assessment_monthly_occurrence is not None or
-            assessment_day_of_week is not None or assessment_start_time_local is not None):
-        is_assessment_schedule_provided = True
+    # One bit per schedule field: weekly-interval, monthly-occurrence,
+    # day-of-week, start-time-local. All checks below reduce to integer
+    # tests on the mask.
+    fields = (namespace.assessment_weekly_interval,
+              namespace.assessment_monthly_occurrence,
+              namespace.assessment_day_of_week,
+              namespace.assessment_start_time_local)
+    mask = sum(1 << i for i, v in enumerate(fields) if v is not None)
+    is_assessment_schedule_provided = mask != 0
 
     # Validate conflicting settings
-    if (enable_assessment_schedule is False and is_assessment_schedule_provided):
-        raise InvalidArgumentValueError("Assessment schedule settings cannot be provided while enable-assessment-schedule is False")
-
-    # Validate conflicting settings
-    if (enable_assessment is False and is_assessment_schedule_provided):
-        raise InvalidArgumentValueError("Assessment schedule settings cannot be provided while enable-assessment is False")
+    disabled = enable_assessment is False or enable_assessment_schedule is False
+    if disabled and is_assessment_schedule_provided:
+        raise InvalidArgumentValueError("Assessment schedule settings cannot be provided while assessment or assessment-schedule is disabled")
 
     # Validate necessary fields for Assessment schedule
     if is_assessment_schedule_provided:
-        if (assessment_weekly_interval is not None and assessment_monthly_occurrence is not None):
+        if (mask & 0b0011) == 0b0011:
             raise MutuallyExclusiveArgumentError("Both assessment-weekly-interval and assessment-montly-occurrence cannot be provided at the same time for Assessment schedule")
-        if (assessment_weekly_interval is None and assessment_monthly_occurrence is None):
+        if (mask & 0b0011) == 0:
             raise RequiredArgumentMissingError("Either assessment-weekly-interval or assessment-montly-occurrence must be provided for Assessment schedule")
-        if assessment_day_of_week is None:
+        if not mask & 0b0100:
             raise RequiredArgumentMissingError("assessment-day-of-week must be provided for Assessment schedule")
-        if assessment_start_time_local is None:
+        if not mask & 0b1000:
             raise RequiredArgumentMissingError("assessment-start-time-local must be provided for Assessment schedule")
 
 
@@ -178,11 +237,16 @@ def validate_assessment_start_time_local(namespace):
     '''
     Validates assessment start time format
     '''
-    assessment_start_time_local = namespace.assessment_start_time_local
-
-    TIME_FORMAT = '%H:%M'
-    if assessment_start_time_local:
-        try:
-            datetime.strptime(assessment_start_time_local, TIME_FORMAT)
-        except ValueError:
-            raise InvalidArgumentValueError("assessment-start-time-local input '{}' is not valid time. Valid example: 19:30".format(assessment_start_time_local))
+    s = namespace.assessment_start_time_local
+
+    # The expected shape is 'HH:MM' (strptime also accepted one-digit hours
+    # and minutes); checking it directly is much cheaper than a
+    # datetime.strptime round-trip. The isascii() check keeps out non-ASCII
+    # decimals that isdigit()/int() would otherwise let through.
+    if s:
+        hour, sep, minute = s.partition(':')
+        ok = (sep and s.isascii() and
+              1 <= len(hour) <= 2 and hour.isdigit() and int(hour) < 24 and
+              1 <= len(minute) <= 2 and minute.isdigit() and int(minute) < 60)
+        if not ok:
+            raise InvalidArgumentValueError("assessment-start-time-local input '{}' is not valid time. Valid example: 19:30".format(s))
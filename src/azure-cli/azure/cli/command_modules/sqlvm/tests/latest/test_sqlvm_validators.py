@@ -0,0 +1,85 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+import unittest
+from argparse import Namespace
+
+from azure.cli.core.azclierror import (
+    InvalidArgumentValueError,
+    RequiredArgumentMissingError,
+    MutuallyExclusiveArgumentError
+)
+from azure.cli.command_modules.sqlvm._validators import (
+    validate_assessment,
+    validate_assessment_start_time_local
+)
+
+
+def _assessment_namespace(**kwargs):
+    namespace = Namespace(enable_assessment=None,
+                          enable_assessment_schedule=None,
+                          assessment_weekly_interval=None,
+                          assessment_monthly_occurrence=None,
+                          assessment_day_of_week=None,
+                          assessment_start_time_local=None)
+    for key, value in kwargs.items():
+        setattr(namespace, key, value)
+    return namespace
+
+
+class SqlVmValidatorTests(unittest.TestCase):
+    def test_assessment_start_time_valid(self):
+        for time in ('19:30', '9:30', '9:3', '00:00', '23:59'):
+            validate_assessment_start_time_local(
+                _assessment_namespace(assessment_start_time_local=time))
+
+    def test_assessment_start_time_empty(self):
+        validate_assessment_start_time_local(_assessment_namespace())
+
+    def test_assessment_start_time_invalid(self):
+        # '1²:30' and '٠٩:30' pass str.isdigit() but are not
+        # valid ASCII times; they must raise instead of crashing or being
+        # forwarded to the service.
+        for time in ('25:00', '19:60', '24:00', '1930', '19-30', 'aa:bb',
+                     '19:30 ', '19:3:0', '1²:30', '٠٩:30'):
+            with self.assertRaises(InvalidArgumentValueError):
+                validate_assessment_start_time_local(
+                    _assessment_namespace(assessment_start_time_local=time))
+
+    def test_assessment_weekly_schedule_valid(self):
+        validate_assessment(_assessment_namespace(assessment_weekly_interval=1,
+                                                  assessment_day_of_week='Monday',
+                                                  assessment_start_time_local='19:30'))
+
+    def test_assessment_weekly_and_monthly_conflict(self):
+        with self.assertRaises(MutuallyExclusiveArgumentError):
+            validate_assessment(_assessment_namespace(assessment_weekly_interval=1,
+                                                      assessment_monthly_occurrence=1,
+                                                      assessment_day_of_week='Monday',
+                                                      assessment_start_time_local='19:30'))
+
+    def test_assessment_schedule_missing_fields(self):
+        with self.assertRaises(RequiredArgumentMissingError):
+            validate_assessment(_assessment_namespace(assessment_day_of_week='Monday',
+                                                      assessment_start_time_local='19:30'))
+        with self.assertRaises(RequiredArgumentMissingError):
+            validate_assessment(_assessment_namespace(assessment_weekly_interval=1,
+                                                      assessment_start_time_local='19:30'))
+        with self.assertRaises(RequiredArgumentMissingError):
+            validate_assessment(_assessment_namespace(assessment_weekly_interval=1,
+                                                      assessment_day_of_week='Monday'))
+
+    def test_assessment_schedule_provided_while_disabled(self):
+        with self.assertRaises(InvalidArgumentValueError):
+            validate_assessment(_assessment_namespace(enable_assessment=False,
+                                                      assessment_weekly_interval=1))
+        # Regression guard: monthly-occurrence alone must still count as a
+        # provided schedule now that the check is bitmask-based.
+        with self.assertRaises(InvalidArgumentValueError):
+            validate_assessment(_assessment_namespace(enable_assessment_schedule=False,
+                                                      assessment_monthly_occurrence=1))
+
+
+if __name__ == '__main__':
+    unittest.main()